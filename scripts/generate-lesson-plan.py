@@ -19,14 +19,25 @@ import os
 import requests
 import tempfile
 import re
+import bisect
+import functools
+import sqlite3
+import time
+import threading
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 from urllib.parse import urlparse
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
+from docx.oxml.ns import qn
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
 
 # PowerPoint imports for presentations
+import pptx
 from pptx import Presentation
 from pptx.util import Inches as PptxInches, Pt as PptxPt
 from pptx.dml.color import RGBColor as PptxRGBColor
@@ -72,15 +83,42 @@ UNIT_COLOR_THEMES = {
 # Default theme (navy)
 DEFAULT_COLOR_THEME = (PptxRGBColor(0x1a, 0x3c, 0x6e), PptxRGBColor(0xD6, 0xE3, 0xF8), PptxRGBColor(0x34, 0x98, 0xDB))
 
+# Presentation constants, built once instead of per slide / per bullet
+PPTX_WHITE = PptxRGBColor(0xFF, 0xFF, 0xFF)
+PPTX_DARK_GRAY = PptxRGBColor(0x33, 0x33, 0x33)
+PPTX_NAVY_BLUE = PptxRGBColor(0x1a, 0x3c, 0x6e)       # Bell Ringer deck
+PPTX_LIGHT_BLUE = PptxRGBColor(0xD6, 0xE3, 0xF8)
+PPTX_VIDEO_BG = PptxRGBColor(0x20, 0x20, 0x20)         # Video placeholder
+SLIDE_WIDTH = PptxInches(13.333)           # 16:9
+SLIDE_HEIGHT = PptxInches(7.5)
+BULLET_FONT_SIZE = PptxPt(24)
+BULLET_SPACE_AFTER = PptxPt(12)
+AGENDA_TIME_FONT_SIZE = PptxPt(14)
+AGENDA_NAME_FONT_SIZE = PptxPt(22)
+VOCAB_FONT_SIZE = PptxPt(18)
+VOCAB_TERM_SPACE_BEFORE = PptxPt(8)
+TAKEAWAY_FONT_SIZE = PptxPt(16)
+
+# Schedule activity names (lowercased) that mark the bell ringer, those that
+# get their own activity slide, and those that hold the exit ticket
+BELL_RINGER_NAME_RE = re.compile(r'bell ?ringer|warm ?up')
+ACTIVITY_SLIDE_NAME_RE = re.compile(r'practice|activity|hands-on|work time|project')
+EXIT_TICKET_NAME_RE = re.compile(r'wrap|exit|reflection')
+
 
 # Allowed domains for image downloads (SSRF protection)
 ALLOWED_IMAGE_DOMAINS = {'images.pexels.com'}
 
 
+# Characters not allowed in generated filenames
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-]')
+
+
 def sanitize_filename(name, max_length=25):
     """Remove all characters except alphanumeric, hyphens, and underscores."""
-    sanitized = re.sub(r'[^\w\-]', '_', name)
-    return sanitized[:max_length] or 'Untitled'
+    # Each character maps to exactly one character, so truncating first is equivalent
+    sanitized = UNSAFE_FILENAME_CHARS_RE.sub('_', name[:max_length])
+    return sanitized or 'Untitled'
 
 
 # ============================================================================
@@ -124,8 +162,13 @@ def download_image(url):
         return None
 
 
-def get_topic_image(topic, context="media production"):
-    """Get an image for a topic. Returns BytesIO image data or None."""
+@functools.lru_cache(maxsize=64)
+def fetch_topic_image(topic, context="media production"):
+    """
+    Find and download an image for a topic. Returns (image bytes, image_url)
+    or (None, None). Cached for the run, since the objectives and topic
+    slides both look up the day's topic.
+    """
     # Build search query with context
     search_terms = [
         f"{topic} {context}",
@@ -139,11 +182,88 @@ def get_topic_image(topic, context="media production"):
         if image_url:
             image_data = download_image(image_url)
             if image_data:
-                return image_data, image_url
+                return image_data.getvalue(), image_url
 
     return None, None
 
 
+def get_topic_image(topic, context="media production"):
+    """Get an image for a topic. Returns (BytesIO image data, image_url) or (None, None)."""
+    image_bytes, image_url = fetch_topic_image(topic, context)
+    if image_bytes is None:
+        return None, None
+    # Fresh stream per call; add_picture reads it to the end
+    return BytesIO(image_bytes), image_url
+
+
+# ============================================================================
+# SEARCH RESULT CACHE
+# ============================================================================
+
+# On-disk cache of web video searches (topic -> video), shared across runs
+SEARCH_CACHE_PATH = os.environ.get('CTE_CACHE_PATH', '') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'cte-lesson-generator', 'search-cache.sqlite3')
+VIDEO_CACHE_TTL = 30 * 24 * 60 * 60           # Found videos: 30 days
+VIDEO_CACHE_NEGATIVE_TTL = 24 * 60 * 60       # "No video found": 1 day
+
+_search_cache = None
+
+
+def get_search_cache():
+    """Open (once) and return the sqlite search cache, or None if unavailable."""
+    global _search_cache
+    if _search_cache is None:
+        try:
+            # abspath so a bare filename in CTE_CACHE_PATH resolves to the cwd
+            os.makedirs(os.path.dirname(os.path.abspath(SEARCH_CACHE_PATH)), exist_ok=True)
+            # Video lookups may run on a prefetch thread (see
+            # generate_daily_presentation); each access is a single statement
+            conn = sqlite3.connect(SEARCH_CACHE_PATH, check_same_thread=False)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS ddg_cache '
+                '(topic TEXT PRIMARY KEY, url TEXT, title TEXT, ts REAL)'
+            )
+            _search_cache = conn
+        except (OSError, sqlite3.Error) as e:
+            print(f"Search cache unavailable: {e}", file=sys.stderr)
+            _search_cache = False
+    return _search_cache or None
+
+
+def load_cached_video(topic_key):
+    """Return a cached (video_url, video_title) for a topic, or None on a miss."""
+    conn = get_search_cache()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute('SELECT url, title, ts FROM ddg_cache WHERE topic = ?', (topic_key,)).fetchone()
+    except sqlite3.Error as e:
+        print(f"Search cache read error: {e}", file=sys.stderr)
+        return None
+    if row is None:
+        return None
+    url, title, ts = row
+    ttl = VIDEO_CACHE_TTL if url else VIDEO_CACHE_NEGATIVE_TTL
+    if time.time() - ts > ttl:
+        return None
+    return url, title
+
+
+def store_cached_video(topic_key, url, title):
+    """Store a search result (or a negative result when url is None)."""
+    conn = get_search_cache()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO ddg_cache (topic, url, title, ts) VALUES (?, ?, ?, ?)',
+                (topic_key, url, title, time.time())
+            )
+    except sqlite3.Error as e:
+        print(f"Search cache write error: {e}", file=sys.stderr)
+
+
 # ============================================================================
 # YOUTUBE VIDEO SEARCH FUNCTIONS
 # ============================================================================
@@ -183,6 +303,62 @@ CURATED_VIDEOS = {
     'film history': ('https://www.youtube.com/watch?v=HCYJBwY-Qsc', 'History of Cinema'),
 }
 
+# Lookup structures for CURATED_VIDEOS, built once at import.
+# Keywords earlier in CURATED_VIDEOS take priority when several match.
+_CURATED_KEYWORDS = tuple(CURATED_VIDEOS)
+_CURATED_RANK = {keyword: i for i, keyword in enumerate(_CURATED_KEYWORDS)}
+# Zero-width lookahead reports a match at every position (overlaps included);
+# alternatives are listed in priority order so each position yields its best keyword
+_CURATED_KEYWORD_RE = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in _CURATED_KEYWORDS) + '))')
+# All keywords joined into one string for word-in-keyword lookups via str.find
+_CURATED_HAYSTACK = '\n'.join(_CURATED_KEYWORDS)
+_CURATED_OFFSETS = []
+_offset = 0
+for _keyword in _CURATED_KEYWORDS:
+    _CURATED_OFFSETS.append(_offset)
+    _offset += len(_keyword) + 1
+del _offset, _keyword
+# Every 3-character substring of any keyword (all keywords are 3+ characters).
+# Any match (keyword in topic, topic in keyword, or topic word in keyword)
+# shares at least one trigram with the topic, so a topic with no trigram in
+# this set cannot match.
+_CURATED_TRIGRAMS = frozenset(
+    keyword[i:i + 3] for keyword in _CURATED_KEYWORDS for i in range(len(keyword) - 2)
+)
+
+
+def match_curated_video(topic_lower):
+    """
+    Match a normalized topic against the curated video library.
+    Returns (video_url, video_title) or (None, None).
+    """
+    # Cheap negative check before scanning (short topics can't be prefiltered)
+    if len(topic_lower) >= 3 and not any(
+        topic_lower[i:i + 3] in _CURATED_TRIGRAMS for i in range(len(topic_lower) - 2)
+    ):
+        return None, None
+
+    # Keyword contained in topic, or topic contained in keyword
+    matches = {m.group(1) for m in _CURATED_KEYWORD_RE.finditer(topic_lower)}
+    matches.update(kw for kw in _CURATED_KEYWORDS if topic_lower in kw)
+    if matches:
+        return CURATED_VIDEOS[min(matches, key=_CURATED_RANK.__getitem__)]
+
+    # Partial matches: a topic word (4+ chars) inside a keyword. The first
+    # occurrence in the haystack belongs to the highest-priority keyword.
+    best = None
+    for word in topic_lower.split():
+        if len(word) > 3:
+            pos = _CURATED_HAYSTACK.find(word)
+            if pos != -1:
+                rank = bisect.bisect_right(_CURATED_OFFSETS, pos) - 1
+                if best is None or rank < best:
+                    best = rank
+    if best is not None:
+        return CURATED_VIDEOS[_CURATED_KEYWORDS[best]]
+
+    return None, None
+
 
 def search_youtube_video(topic, preferred_channels=None):
     """
@@ -194,45 +370,123 @@ def search_youtube_video(topic, preferred_channels=None):
     topic_lower = topic.lower().strip()
 
     # Check curated videos first (most reliable)
-    for keyword, (url, title) in CURATED_VIDEOS.items():
-        if keyword in topic_lower or topic_lower in keyword:
-            return url, title
-
-    # Check for partial matches
-    topic_words = topic_lower.split()
-    for keyword, (url, title) in CURATED_VIDEOS.items():
-        for word in topic_words:
-            if len(word) > 3 and word in keyword:
-                return url, title
-
-    # Fallback: Try web search
+    url, title = match_curated_video(topic_lower)
+    if url:
+        return url, title
+
+    # Fallback: Try web search (cached across runs)
+    return search_web_video(' '.join(topic_lower.split()))
+
+
+# Shared DuckDuckGo client (created on first web search)
+_ddgs = None
+_ddgs_lock = threading.Lock()
+
+# Attempts per query when DuckDuckGo rate limits (waits 1s, 2s, ... between)
+DDG_MAX_ATTEMPTS = 3
+
+
+def get_ddgs():
+    """
+    Return the shared DuckDuckGo search client, importing and creating it on
+    first use. Reusing one client keeps its HTTP connection pool alive
+    across searches instead of reconnecting for every topic.
+    """
+    global _ddgs
+    with _ddgs_lock:
+        if _ddgs is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                from duckduckgo_search import DDGS
+            _ddgs = DDGS()
+        return _ddgs
+
+
+def is_ddg_ratelimit(error):
+    """
+    True if a DuckDuckGo search error is a rate limit. DDGS.text() wraps the
+    backend's RatelimitException in a DuckDuckGoSearchException, so the cause,
+    context and first argument are checked as well.
+    """
+    from duckduckgo_search.exceptions import RatelimitException
+    candidates = (error, error.__cause__, error.__context__, error.args[0] if error.args else None)
+    return any(isinstance(candidate, RatelimitException) for candidate in candidates)
+
+
+def ddg_text_search(ddgs, query, max_results=10):
+    """Run a DuckDuckGo text search, backing off exponentially when rate limited."""
+    for attempt in range(DDG_MAX_ATTEMPTS):
+        try:
+            # The html backend is less prone to rate limiting
+            return list(ddgs.text(query, backend='html', max_results=max_results))
+        except Exception as e:
+            if attempt == DDG_MAX_ATTEMPTS - 1 or not is_ddg_ratelimit(e):
+                raise
+            time.sleep(2 ** attempt)
+
+
+def find_web_video(topic_key):
+    """
+    Search DuckDuckGo for a YouTube video on a normalized topic, checking the
+    disk cache first. Returns ((video_url, video_title) or (None, None),
+    completed), where completed is False if any query failed.
+    """
+    cached = load_cached_video(topic_key)
+    if cached is not None:
+        return cached, True
+
+    completed = True
     try:
-        import warnings
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            from duckduckgo_search import DDGS
+        ddgs = get_ddgs()
 
         search_queries = [
-            f'{topic} filmmaking tutorial youtube',
-            f'{topic} video production tutorial',
+            f'{topic_key} filmmaking tutorial youtube',
+            f'{topic_key} video production tutorial',
         ]
 
-        with DDGS() as ddgs:
-            for query in search_queries:
-                try:
-                    results = list(ddgs.text(query, max_results=10))
-                    for result in results:
-                        url = result.get('href', '')
-                        title = result.get('title', '')
-                        if 'youtube.com/watch' in url or 'youtu.be/' in url:
-                            return url, title
-                except Exception as e:
-                    print(f"DuckDuckGo search error for '{query}': {e}", file=sys.stderr)
-                    continue
+        for query in search_queries:
+            try:
+                results = ddg_text_search(ddgs, query)
+                for result in results:
+                    url = result.get('href', '')
+                    title = result.get('title', '')
+                    if 'youtube.com/watch' in url or 'youtu.be/' in url:
+                        store_cached_video(topic_key, url, title)
+                        return (url, title), True
+            except Exception as e:
+                print(f"DuckDuckGo search error for '{query}': {e}", file=sys.stderr)
+                completed = False
+                continue
+
+        # Only remember "no video" when every query actually ran
+        if completed:
+            store_cached_video(topic_key, None, None)
     except Exception as e:
         print(f"Web search unavailable: {e}", file=sys.stderr)
+        completed = False
+
+    return (None, None), completed
 
-    return None, None
+
+# Completed web video lookups for this run (topic_key -> (url, title)).
+# Failed searches are left out so a later day can retry the topic.
+_web_video_results = {}
+
+
+def search_web_video(topic_key):
+    """
+    Find a YouTube video for a normalized topic, remembering completed lookups
+    for the rest of the run. Returns (video_url, video_title) or (None, None).
+    """
+    result = _web_video_results.get(topic_key)
+    if result is None:
+        result, completed = find_web_video(topic_key)
+        if completed:
+            _web_video_results[topic_key] = result
+    return result
+
+# Video ID from youtu.be/<id> or youtube.com/watch?...v=<id> URLs
+YOUTUBE_ID_RE = re.compile(r'(?:youtu\.be/|youtube\.com/watch\S*?[?&]v=)([a-zA-Z0-9_-]+)')
 
 
 def get_youtube_video_id(url):
@@ -240,19 +494,8 @@ def get_youtube_video_id(url):
     if not url:
         return None
 
-    # Handle youtu.be format
-    if 'youtu.be/' in url:
-        match = re.search(r'youtu\.be/([a-zA-Z0-9_-]+)', url)
-        if match:
-            return match.group(1)
-
-    # Handle youtube.com/watch format
-    if 'youtube.com/watch' in url:
-        match = re.search(r'[?&]v=([a-zA-Z0-9_-]+)', url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 # ============================================================================
@@ -322,6 +565,37 @@ def get_output_dir():
 TEMPLATE_PATH = find_template_path()
 OUTPUT_DIR = get_output_dir()
 
+
+@functools.lru_cache(maxsize=1)
+def load_template_bytes():
+    """Read the CTE template once; each lesson plan opens its own copy from memory."""
+    with open(TEMPLATE_PATH, 'rb') as f:
+        return f.read()
+
+
+# python-pptx's built-in blank template (what Presentation() opens by default)
+PPTX_DEFAULT_TEMPLATE_PATH = os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx')
+
+
+@functools.lru_cache(maxsize=1)
+def load_presentation_template_bytes():
+    """Read the default presentation template once; each deck opens its own copy from memory."""
+    with open(PPTX_DEFAULT_TEMPLATE_PATH, 'rb') as f:
+        return f.read()
+
+
+def save_presentation(prs, output_path):
+    """
+    Save a presentation by building the zip in memory and writing it with a
+    single call. An error while serializing the deck leaves any existing file
+    untouched; the file is only opened (and truncated) once the zip is built.
+    """
+    buf = BytesIO()
+    prs.save(buf)
+    with open(output_path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+
 # Checkbox mappings
 MATERIALS_CHECKBOXES = {
     'textbook': 'Textbook',
@@ -384,8 +658,131 @@ OTHER_AREAS_CHECKBOXES = {
 }
 
 
+# ============================================================================
+# CONTENT INFERENCE KEYWORDS
+# ============================================================================
+
+# Keywords that suggest each checkbox, matched as substrings of lowercased lesson text.
+# Areas are checked in table order, which is also the order they are added.
+OTHER_AREAS_KEYWORDS = {
+    # Equipment handling, safety procedures
+    'safety': ['safety', 'equipment', 'handling', 'protective', 'hazard', 'proper use', 'safely', 'precaution'],
+    # Time management, organization, planning
+    'management_skills': ['time management', 'organize', 'planning', 'schedule', 'project management', 'workflow', 'deadline'],
+    # Collaborative work
+    'teamwork': ['team', 'group', 'collaborat', 'partner', 'cooperative', 'crew', 'together'],
+    # Real client/real-world production (rare, usually explicit)
+    'live_work': ['client', 'real-world', 'live production', 'actual client', 'community partner'],
+    # Analysis, evaluation, creation, critique
+    'higher_order_reasoning': ['analyze', 'evaluat', 'create', 'critiqu', 'compare', 'synthesize', 'design', 'develop', 'assess'],
+    # Multiple modalities, different learning styles (also set by differentiation)
+    'varied_learning': ['visual', 'hands-on', 'demonstration', 'practice', 'kinesthetic', 'auditory'],
+    # Professionalism, responsibility, deadlines
+    'work_ethics': ['professional', 'responsibility', 'deadline', 'punctual', 'quality', 'ethic', 'industry standard'],
+    # SkillsUSA, competitions, career development
+    'ctso': ['skillsusa', 'ctso', 'competition', 'career development', 'leadership'],
+    # Troubleshooting, debugging, challenges
+    'problem_solving': ['problem', 'solve', 'troubleshoot', 'debug', 'fix', 'challenge', 'solution', 'figure out'],
+}
+
+CURRICULUM_KEYWORDS = {
+    # Almost always applies for media production
+    'technology': ['camera', 'editing', 'software', 'premiere', 'photoshop', 'computer', 'digital', 'video', 'audio', 'equipment'],
+    # Scriptwriting, storytelling, research
+    'english': ['script', 'writing', 'story', 'narrative', 'reading', 'research', 'interview', 'article', 'news'],
+    # Subset of the English keywords, so Reading is only ever added alongside English
+    'reading': ['reading', 'research', 'article'],
+    # Composition, visual design, creativity
+    'fine_arts': ['composition', 'visual', 'design', 'aesthetic', 'creative', 'artistic', 'color', 'lighting', 'framing'],
+    # Exposure triangle, ratios, frame rates
+    'math': ['exposure', 'ratio', 'frame rate', 'aperture', 'shutter speed', 'iso', 'calculation', 'percentage'],
+    # Light, sound waves, physics of cameras
+    'science': ['light', 'sound wave', 'physics', 'optics', 'frequency', 'wavelength'],
+    # Documentary, history, PSA topics, news
+    'social_studies': ['history', 'documentary', 'social', 'community', 'culture', 'news', 'current events', 'psa', 'public service'],
+}
+
+MATERIALS_KEYWORDS = {
+    # Presentations, showing videos, demonstrations
+    'projector': ['presentation', 'present', 'show', 'display', 'screen', 'projector', 'slides', 'powerpoint'],
+    # Editing, software, digital work
+    'computer': ['computer', 'premiere', 'photoshop', 'editing', 'software', 'digital', 'laptop', 'workstation'],
+    # Watching examples, film clips, demonstrations
+    'video_dvd': ['video', 'watch', 'film', 'movie', 'clip', 'example', 'youtube', 'dvd'],
+    # Hands-on activities, practice, studio work
+    'labs': ['lab', 'studio', 'hands-on', 'practice', 'filming', 'shoot', 'record'],
+    # Audio playback
+    'speaker': ['audio', 'sound', 'music', 'listen', 'speaker', 'playback'],
+    # Handouts, worksheets, guides
+    'supplemental_materials': ['handout', 'worksheet', 'guide', 'reference', 'template', 'storyboard', 'script'],
+    # Cameras, tripods, lighting, microphones
+    'other_equipment': ['camera', 'tripod', 'lighting', 'light', 'microphone', 'mic', 'equipment', 'gear', 'sd card', 'memory card'],
+    # Reflection, note-taking
+    'student_journals': ['journal', 'notebook', 'notes', 'reflection', 'write', 'record thoughts'],
+    # Visual aids, reference charts
+    'posters': ['poster', 'chart', 'diagram', 'visual aid', 'infographic'],
+}
+
+METHODS_KEYWORDS = {
+    # Class discussion, group discussion, Q&A
+    'discussion': ['discussion', 'discuss', 'debate', 'share', 'q&a', 'conversation', 'talk about'],
+    # Showing how to do something
+    'demonstration': ['demonstrat', 'show how', 'model', 'walk through', 'example', 'tutorial'],
+    # Direct instruction, teaching, explaining (also set by LECTURE_ACTIVITY_NAMES)
+    'lecture': ['lecture', 'direct instruction', 'teach', 'explain', 'present content', 'introduce'],
+    # Presentations, slides
+    'powerpoint': ['powerpoint', 'presentation', 'slides', 'slide deck', 'pptx'],
+    # Videos, audio, digital content
+    'multimedia': ['video', 'multimedia', 'multi-media', 'youtube', 'film', 'audio', 'digital'],
+    # Industry professional, visitor
+    'guest_speaker': ['guest speaker', 'guest', 'industry professional', 'visitor', 'expert'],
+}
+
+# Schedule activity names that always count as a lecture
+LECTURE_ACTIVITY_NAMES = {'direct instruction', 'lecture', 'mini-lecture', 'instruction'}
+
+ASSESSMENT_KEYWORDS = {
+    # In-class activities, practice, exit tickets
+    'classwork': ['classwork', 'class work', 'activity', 'practice', 'exercise', 'in-class', 'work on',
+                  'exit ticket', 'exit slip', 'reflection'],
+    # Teacher watching, monitoring
+    'observation': ['observ', 'monitor', 'circulate', 'watch', 'check in', 'walk around'],
+    # Projects, final products, deliverables
+    'project_based': ['project', 'final', 'deliverable', 'portfolio', 'create', 'produce', 'video project'],
+    # Group work, collaboration, partner work
+    'teamwork': ['team', 'group', 'partner', 'collaborat', 'crew', 'together', 'peer'],
+    # Demonstrations, presentations by students
+    'performance': ['perform', 'present', 'demonstrat', 'show', 'pitch', 'share out'],
+    # Participation, engagement
+    'on_task': ['participat', 'engag', 'on-task', 'focused', 'active'],
+    # Quiz, exam, test
+    'test': ['test', 'quiz', 'exam', 'assessment'],
+    # Take-home, assignment
+    'homework': ['homework', 'home work', 'take home', 'assignment', 'due next'],
+}
+
+
+def compile_keyword_patterns(keyword_map):
+    """
+    Compile each keyword list into one regex alternation (single scan per area).
+    Returns an ordered tuple of (area, pattern) pairs.
+    """
+    return tuple(
+        (area, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+        for area, keywords in keyword_map.items()
+    )
+
+
+OTHER_AREAS_PATTERNS = compile_keyword_patterns(OTHER_AREAS_KEYWORDS)
+CURRICULUM_PATTERNS = compile_keyword_patterns(CURRICULUM_KEYWORDS)
+MATERIALS_PATTERNS = compile_keyword_patterns(MATERIALS_KEYWORDS)
+METHODS_PATTERNS = compile_keyword_patterns(METHODS_KEYWORDS)
+ASSESSMENT_PATTERNS = compile_keyword_patterns(ASSESSMENT_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=32)
 def get_week_folder(week_num):
-    """Get the week folder path, creating it if needed."""
+    """Get the week folder path, creating it if needed (once per week number)."""
     # Ensure week number is zero-padded for proper sorting
     week_str = str(week_num).zfill(2)
     week_folder = os.path.join(OUTPUT_DIR, f"Week{week_str}")
@@ -393,47 +790,81 @@ def get_week_folder(week_num):
     return week_folder
 
 
+# Run color elements that remove_red_text inspects: runs in top-level table
+# cells and runs in body paragraphs
+RUN_COLORS_XPATH = './w:body/w:tbl/w:tr/w:tc/w:p/w:r/w:rPr/w:color | ./w:body/w:p/w:r/w:rPr/w:color'
+# Table-cell runs with no explicit color (forced to black)
+UNCOLORED_TABLE_RUNS_XPATH = './w:body/w:tbl/w:tr/w:tc/w:p/w:r[not(w:rPr/w:color)]'
+W_VAL = qn('w:val')
+
+
+def is_red_hex(value):
+    """Return True if an OOXML hex color value (e.g. 'C00000') is red-ish."""
+    if not value or len(value) != 6:
+        return False
+    try:
+        packed = int(value, 16)
+    except ValueError:
+        # 'auto' or malformed values
+        return False
+    return (packed >> 16) > 150 and ((packed >> 8) & 0xFF) < 100 and (packed & 0xFF) < 100
+
+
 def remove_red_text(doc):
     """Remove red color from all text in the document, making it black."""
     BLACK = RGBColor(0, 0, 0)
+    root = doc.element
+
+    # Works on the XML directly (one XPath query each) instead of walking
+    # python-docx table/row/cell/paragraph/run wrapper objects
+    # Red colors are rewritten in place; clearing drops any theme color
+    # attributes, same as replacing the element through python-docx
+    for color in root.xpath(RUN_COLORS_XPATH):
+        if is_red_hex(color.get(W_VAL)):
+            color.attrib.clear()
+            color.set(W_VAL, '000000')
+
+    # Also ensure any uncolored table text is black
+    for run in root.xpath(UNCOLORED_TABLE_RUNS_XPATH):
+        run.get_or_add_rPr().get_or_add_color().val = BLACK
+
+
+def compile_checkbox_pattern(checkbox_map):
+    """
+    Compile one regex matching a blank (underscores) followed by any label in
+    the map. Returns (pattern, {lowercased label: (key, label)}).
+    """
+    labels = '|'.join(re.escape(label) for label in checkbox_map.values())
+    pattern = re.compile(r'_+(\s*)(' + labels + ')', re.IGNORECASE)
+    return pattern, {label.lower(): (key, label) for key, label in checkbox_map.items()}
 
-    # Process all tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    for run in para.runs:
-                        # Check if text has red color
-                        if run.font.color.rgb:
-                            color = run.font.color.rgb
-                            # If it's red-ish, change to black
-                            if color[0] > 150 and color[1] < 100 and color[2] < 100:
-                                run.font.color.rgb = BLACK
-                        # Also ensure any new text is black
-                        if run.font.color.type is None:
-                            run.font.color.rgb = BLACK
-
-    # Process paragraphs outside tables
-    for para in doc.paragraphs:
-        for run in para.runs:
-            if run.font.color.rgb:
-                color = run.font.color.rgb
-                if color[0] > 150 and color[1] < 100 and color[2] < 100:
-                    run.font.color.rgb = BLACK
+
+# Precompiled patterns for the template's checkbox groups, keyed by map identity
+CHECKBOX_PATTERNS = {
+    id(checkbox_map): compile_checkbox_pattern(checkbox_map)
+    for checkbox_map in (MATERIALS_CHECKBOXES, METHODS_CHECKBOXES, ASSESSMENT_CHECKBOXES,
+                         CURRICULUM_CHECKBOXES, OTHER_AREAS_CHECKBOXES)
+}
 
 
 def mark_checkboxes_in_cell(cell, checkbox_map, selected_items):
     """Mark checkboxes in a cell by replacing underscores with checkmarks."""
-    import re
+    if not selected_items:
+        return
+    pattern, labels = CHECKBOX_PATTERNS.get(id(checkbox_map)) or compile_checkbox_pattern(checkbox_map)
+
+    def mark(match):
+        key, label = labels[match.group(2).lower()]
+        if key in selected_items:
+            return 'X' + match.group(1) + label
+        return match.group(0)
+
     for para in cell.paragraphs:
         for run in para.runs:
             text = run.text
-            for key, label in checkbox_map.items():
-                if key in selected_items:
-                    pattern = r'_+(\s*)' + re.escape(label)
-                    if re.search(pattern, text, re.IGNORECASE):
-                        text = re.sub(pattern, r'X\1' + label, text, flags=re.IGNORECASE)
-            run.text = text
+            marked = pattern.sub(mark, text)
+            if marked != text:
+                run.text = marked
 
 
 def set_cell_text(cell, text):
@@ -458,6 +889,19 @@ def set_cell_text(cell, text):
         run.font.color.rgb = BLACK
 
 
+def format_schedule_activity(activity):
+    """Format one schedule entry as a procedures line (None if it has no name)."""
+    if not isinstance(activity, dict):
+        return str(activity)
+    time_text = activity.get('time') if 'time' in activity else activity.get('duration', '')
+    name = activity.get('name') if 'name' in activity else activity.get('activity', '')
+    desc = activity.get('description', '')
+    if not name:
+        return None
+    line = f"{time_text} - {name}" if time_text else name
+    return f"{line}: {desc}" if desc else line
+
+
 def build_procedures_text(day_data):
     """Build the Procedures/Activities/Learning Experiences text from schedule data."""
     procedures = day_data.get('procedures', '')
@@ -465,24 +909,17 @@ def build_procedures_text(day_data):
         return procedures
 
     # Build from schedule if no explicit procedures provided
-    schedule = day_data.get('schedule', [])
-    if not schedule:
-        return ''
+    schedule = day_data.get('schedule') or ()
+    return '\n'.join(line for line in map(format_schedule_activity, schedule) if line is not None)
 
-    lines = []
-    for activity in schedule:
-        if isinstance(activity, dict):
-            time = activity.get('time', activity.get('duration', ''))
-            name = activity.get('name', activity.get('activity', ''))
-            desc = activity.get('description', '')
-            if time and name:
-                lines.append(f"{time} - {name}: {desc}" if desc else f"{time} - {name}")
-            elif name:
-                lines.append(f"{name}: {desc}" if desc else name)
-        else:
-            lines.append(str(activity))
 
-    return '\n'.join(lines)
+# Known differentiation levels, in output order, with their display labels
+DIFFERENTIATION_LABELS = (
+    ('Advanced', 'Advanced Learners'),
+    ('Struggling', 'Struggling Learners'),
+    ('ELL', 'ELL Students'),
+)
+DIFFERENTIATION_LEVELS = frozenset(level for level, _ in DIFFERENTIATION_LABELS)
 
 
 def build_differentiation_text(day_data):
@@ -500,319 +937,132 @@ def build_differentiation_text(day_data):
         return diff
 
     lines = []
-    if diff.get('Advanced'):
-        lines.append(f"Advanced Learners: {diff['Advanced']}")
-    if diff.get('Struggling'):
-        lines.append(f"Struggling Learners: {diff['Struggling']}")
-    if diff.get('ELL'):
-        lines.append(f"ELL Students: {diff['ELL']}")
+    for level, label in DIFFERENTIATION_LABELS:
+        strategy = diff.get(level)
+        if strategy:
+            lines.append(f"{label}: {strategy}")
 
     # Handle any other differentiation levels
-    for level, strategy in diff.items():
-        if level not in ['Advanced', 'Struggling', 'ELL']:
-            lines.append(f"{level}: {strategy}")
+    lines.extend(f"{level}: {strategy}" for level, strategy in diff.items()
+                 if level not in DIFFERENTIATION_LEVELS)
 
     return '\n'.join(lines)
 
 
-def infer_other_areas(day_data, curriculum_areas):
+def get_lesson_text(day_data, include_schedule=True, include_materials=False):
+    """Build the lowercased lesson text that the infer_* functions scan for keywords."""
+    parts = [
+        day_data.get('topic', ''),
+        day_data.get('overview', ''),
+        ' '.join(day_data.get('objectives', [])),
+    ]
+    if include_materials:
+        parts.append(' '.join(day_data.get('day_materials', [])))
+    if include_schedule:
+        schedule_text = ''
+        for activity in day_data.get('schedule', []):
+            if isinstance(activity, dict):
+                schedule_text += ' ' + activity.get('name', '') + ' ' + activity.get('description', '')
+        parts.append(schedule_text)
+    return ' '.join(parts).lower()
+
+
+def add_keyword_areas(selected, all_text, patterns):
+    """Append each area whose pattern matches all_text; already-selected areas skip the scan."""
+    # Set for the membership checks; areas are unique per table, so only the
+    # caller's preselected ones need tracking
+    already_selected = set(selected)
+    for area, pattern in patterns:
+        if area not in already_selected and pattern.search(all_text):
+            selected.append(area)
+
+
+def infer_other_areas(day_data, curriculum_areas, all_text=None):
     """Infer other areas addressed based on lesson content."""
     other_areas = list(day_data.get('other_areas', []))
 
     # Get all text content to analyze
-    topic = day_data.get('topic', '').lower()
-    overview = day_data.get('overview', '').lower()
-    objectives = ' '.join(day_data.get('objectives', [])).lower()
-    schedule_text = ''
-    for activity in day_data.get('schedule', []):
-        if isinstance(activity, dict):
-            schedule_text += ' ' + activity.get('name', '') + ' ' + activity.get('description', '')
-    schedule_text = schedule_text.lower()
-    all_text = f"{topic} {overview} {objectives} {schedule_text}"
-
-    # Safety - equipment handling, safety procedures
-    if any(word in all_text for word in ['safety', 'equipment', 'handling', 'protective', 'hazard', 'proper use', 'safely', 'precaution']):
-        if 'safety' not in other_areas:
-            other_areas.append('safety')
-
-    # Management Skills - time management, organization, planning
-    if any(word in all_text for word in ['time management', 'organize', 'planning', 'schedule', 'project management', 'workflow', 'deadline']):
-        if 'management_skills' not in other_areas:
-            other_areas.append('management_skills')
-
-    # Teamwork - collaborative work
-    if any(word in all_text for word in ['team', 'group', 'collaborat', 'partner', 'cooperative', 'crew', 'together']):
-        if 'teamwork' not in other_areas:
-            other_areas.append('teamwork')
-
-    # Live Work - real client/real-world production (rare, usually explicit)
-    if any(word in all_text for word in ['client', 'real-world', 'live production', 'actual client', 'community partner']):
-        if 'live_work' not in other_areas:
-            other_areas.append('live_work')
-
-    # Higher Order Reasoning - analysis, evaluation, creation, critique
-    if any(word in all_text for word in ['analyze', 'evaluat', 'create', 'critiqu', 'compare', 'synthesize', 'design', 'develop', 'assess']):
-        if 'higher_order_reasoning' not in other_areas:
-            other_areas.append('higher_order_reasoning')
-
-    # Varied Learning - multiple modalities, different learning styles
-    if any(word in all_text for word in ['visual', 'hands-on', 'demonstration', 'practice', 'kinesthetic', 'auditory']) or \
-       (day_data.get('differentiation') and len(day_data.get('differentiation', {})) > 0):
-        if 'varied_learning' not in other_areas:
-            other_areas.append('varied_learning')
-
-    # Work Ethics - professionalism, responsibility, deadlines
-    if any(word in all_text for word in ['professional', 'responsibility', 'deadline', 'punctual', 'quality', 'ethic', 'industry standard']):
-        if 'work_ethics' not in other_areas:
-            other_areas.append('work_ethics')
+    if all_text is None:
+        all_text = get_lesson_text(day_data)
+    add_keyword_areas(other_areas, all_text, OTHER_AREAS_PATTERNS)
 
-    # Integrated Academics - if curriculum areas are checked
-    if curriculum_areas and len(curriculum_areas) > 0:
-        if 'integrated_academics' not in other_areas:
-            other_areas.append('integrated_academics')
-
-    # CTSO - SkillsUSA, competitions, career development
-    if any(word in all_text for word in ['skillsusa', 'ctso', 'competition', 'career development', 'leadership']):
-        if 'ctso' not in other_areas:
-            other_areas.append('ctso')
+    # Varied Learning - any differentiation implies multiple approaches
+    if day_data.get('differentiation') and 'varied_learning' not in other_areas:
+        other_areas.append('varied_learning')
 
-    # Problem Solving - troubleshooting, debugging, challenges
-    if any(word in all_text for word in ['problem', 'solve', 'troubleshoot', 'debug', 'fix', 'challenge', 'solution', 'figure out']):
-        if 'problem_solving' not in other_areas:
-            other_areas.append('problem_solving')
+    # Integrated Academics - if curriculum areas are checked
+    if curriculum_areas and 'integrated_academics' not in other_areas:
+        other_areas.append('integrated_academics')
 
     return other_areas
 
 
-def infer_curriculum_areas(day_data):
+def infer_curriculum_areas(day_data, all_text=None):
     """Infer integrated curriculum areas based on lesson content."""
     curriculum = list(day_data.get('curriculum', []))
 
-    # Keywords that suggest curriculum integration
-    topic = day_data.get('topic', '').lower()
-    overview = day_data.get('overview', '').lower()
-    objectives = ' '.join(day_data.get('objectives', [])).lower()
-    all_text = f"{topic} {overview} {objectives}"
-
-    # Technology - almost always applies for media production
-    if any(word in all_text for word in ['camera', 'editing', 'software', 'premiere', 'photoshop', 'computer', 'digital', 'video', 'audio', 'equipment']):
-        if 'technology' not in curriculum:
-            curriculum.append('technology')
-
-    # English/Reading - scriptwriting, storytelling, research
-    if any(word in all_text for word in ['script', 'writing', 'story', 'narrative', 'reading', 'research', 'interview', 'article', 'news']):
-        if 'english' not in curriculum:
-            curriculum.append('english')
-        if 'reading' not in curriculum and any(word in all_text for word in ['reading', 'research', 'article']):
-            curriculum.append('reading')
-
-    # Fine Arts - composition, visual design, creativity
-    if any(word in all_text for word in ['composition', 'visual', 'design', 'aesthetic', 'creative', 'artistic', 'color', 'lighting', 'framing']):
-        if 'fine_arts' not in curriculum:
-            curriculum.append('fine_arts')
-
-    # Math - exposure triangle, ratios, frame rates
-    if any(word in all_text for word in ['exposure', 'ratio', 'frame rate', 'aperture', 'shutter speed', 'iso', 'calculation', 'percentage']):
-        if 'math' not in curriculum:
-            curriculum.append('math')
-
-    # Science - light, sound waves, physics of cameras
-    if any(word in all_text for word in ['light', 'sound wave', 'physics', 'optics', 'frequency', 'wavelength']):
-        if 'science' not in curriculum:
-            curriculum.append('science')
-
-    # Social Studies - documentary, history, PSA topics, news
-    if any(word in all_text for word in ['history', 'documentary', 'social', 'community', 'culture', 'news', 'current events', 'psa', 'public service']):
-        if 'social_studies' not in curriculum:
-            curriculum.append('social_studies')
+    # Keywords that suggest curriculum integration (schedule not included)
+    if all_text is None:
+        all_text = get_lesson_text(day_data, include_schedule=False)
+    add_keyword_areas(curriculum, all_text, CURRICULUM_PATTERNS)
 
     return curriculum
 
 
-def infer_materials(day_data):
+def infer_materials(day_data, all_text=None):
     """Infer materials and equipment based on lesson content."""
     materials = list(day_data.get('materials', []))
 
-    # Get all text content to analyze
-    topic = day_data.get('topic', '').lower()
-    overview = day_data.get('overview', '').lower()
-    objectives = ' '.join(day_data.get('objectives', [])).lower()
-    day_materials = ' '.join(day_data.get('day_materials', [])).lower()
-    schedule_text = ''
-    for activity in day_data.get('schedule', []):
-        if isinstance(activity, dict):
-            schedule_text += ' ' + activity.get('name', '') + ' ' + activity.get('description', '')
-    schedule_text = schedule_text.lower()
-    all_text = f"{topic} {overview} {objectives} {day_materials} {schedule_text}"
-
-    # Projector - presentations, showing videos, demonstrations
-    if any(word in all_text for word in ['presentation', 'present', 'show', 'display', 'screen', 'projector', 'slides', 'powerpoint']):
-        if 'projector' not in materials:
-            materials.append('projector')
-
-    # Computer - editing, software, digital work
-    if any(word in all_text for word in ['computer', 'premiere', 'photoshop', 'editing', 'software', 'digital', 'laptop', 'workstation']):
-        if 'computer' not in materials:
-            materials.append('computer')
-
-    # Video/DVD - watching examples, film clips, demonstrations
-    if any(word in all_text for word in ['video', 'watch', 'film', 'movie', 'clip', 'example', 'youtube', 'dvd']):
-        if 'video_dvd' not in materials:
-            materials.append('video_dvd')
-
-    # Labs - hands-on activities, practice, studio work
-    if any(word in all_text for word in ['lab', 'studio', 'hands-on', 'practice', 'filming', 'shoot', 'record']):
-        if 'labs' not in materials:
-            materials.append('labs')
-
-    # Speaker - audio playback
-    if any(word in all_text for word in ['audio', 'sound', 'music', 'listen', 'speaker', 'playback']):
-        if 'speaker' not in materials:
-            materials.append('speaker')
-
-    # Supplemental Materials - handouts, worksheets, guides
-    if any(word in all_text for word in ['handout', 'worksheet', 'guide', 'reference', 'template', 'storyboard', 'script']):
-        if 'supplemental_materials' not in materials:
-            materials.append('supplemental_materials')
-
-    # Other Equipment - cameras, tripods, lighting, microphones
-    if any(word in all_text for word in ['camera', 'tripod', 'lighting', 'light', 'microphone', 'mic', 'equipment', 'gear', 'sd card', 'memory card']):
-        if 'other_equipment' not in materials:
-            materials.append('other_equipment')
-
-    # Student Journals - reflection, note-taking
-    if any(word in all_text for word in ['journal', 'notebook', 'notes', 'reflection', 'write', 'record thoughts']):
-        if 'student_journals' not in materials:
-            materials.append('student_journals')
-
-    # Posters - visual aids, reference charts
-    if any(word in all_text for word in ['poster', 'chart', 'diagram', 'visual aid', 'infographic']):
-        if 'posters' not in materials:
-            materials.append('posters')
+    # Get all text content to analyze (including listed day materials)
+    if all_text is None:
+        all_text = get_lesson_text(day_data, include_materials=True)
+    add_keyword_areas(materials, all_text, MATERIALS_PATTERNS)
 
     return materials
 
 
-def infer_methods(day_data):
+def infer_methods(day_data, all_text=None):
     """Infer instructional methods based on lesson content."""
     methods = list(day_data.get('methods', []))
 
     # Get all text content to analyze
-    topic = day_data.get('topic', '').lower()
-    overview = day_data.get('overview', '').lower()
-    objectives = ' '.join(day_data.get('objectives', [])).lower()
-    schedule_text = ''
-    activity_names = []
-    for activity in day_data.get('schedule', []):
-        if isinstance(activity, dict):
-            name = activity.get('name', '').lower()
-            desc = activity.get('description', '').lower()
-            activity_names.append(name)
-            schedule_text += ' ' + name + ' ' + desc
-    schedule_text = schedule_text.lower()
-    all_text = f"{topic} {overview} {objectives} {schedule_text}"
-
-    # Discussion - class discussion, group discussion, Q&A
-    if any(word in all_text for word in ['discussion', 'discuss', 'debate', 'share', 'q&a', 'conversation', 'talk about']):
-        if 'discussion' not in methods:
-            methods.append('discussion')
-
-    # Demonstration - showing how to do something
-    if any(word in all_text for word in ['demonstrat', 'show how', 'model', 'walk through', 'example', 'tutorial']):
-        if 'demonstration' not in methods:
-            methods.append('demonstration')
-
-    # Lecture - direct instruction, teaching, explaining
-    if any(name in ['direct instruction', 'lecture', 'mini-lecture', 'instruction'] for name in activity_names) or \
-       any(word in all_text for word in ['lecture', 'direct instruction', 'teach', 'explain', 'present content', 'introduce']):
-        if 'lecture' not in methods:
-            methods.append('lecture')
-
-    # PowerPoint - presentations, slides
-    if any(word in all_text for word in ['powerpoint', 'presentation', 'slides', 'slide deck', 'pptx']):
-        if 'powerpoint' not in methods:
-            methods.append('powerpoint')
-
-    # Multi-Media - videos, audio, digital content
-    if any(word in all_text for word in ['video', 'multimedia', 'multi-media', 'youtube', 'film', 'audio', 'digital']):
-        if 'multimedia' not in methods:
-            methods.append('multimedia')
-
-    # Guest Speaker - industry professional, visitor
-    if any(word in all_text for word in ['guest speaker', 'guest', 'industry professional', 'visitor', 'expert']):
-        if 'guest_speaker' not in methods:
-            methods.append('guest_speaker')
+    if all_text is None:
+        all_text = get_lesson_text(day_data)
+    add_keyword_areas(methods, all_text, METHODS_PATTERNS)
+
+    # Lecture - also when a schedule activity is itself direct instruction
+    if 'lecture' not in methods and any(
+        isinstance(activity, dict) and activity.get('name', '').lower() in LECTURE_ACTIVITY_NAMES
+        for activity in day_data.get('schedule', [])
+    ):
+        methods.append('lecture')
 
     return methods
 
 
-def infer_assessment(day_data):
+def infer_assessment(day_data, all_text=None):
     """Infer assessment strategies based on lesson content."""
     assessment = list(day_data.get('assessment', []))
 
     # Get all text content to analyze
-    topic = day_data.get('topic', '').lower()
-    overview = day_data.get('overview', '').lower()
-    objectives = ' '.join(day_data.get('objectives', [])).lower()
-    schedule_text = ''
-    activity_names = []
-    for activity in day_data.get('schedule', []):
-        if isinstance(activity, dict):
-            name = activity.get('name', '').lower()
-            desc = activity.get('description', '').lower()
-            activity_names.append(name)
-            schedule_text += ' ' + name + ' ' + desc
-    schedule_text = schedule_text.lower()
-    all_text = f"{topic} {overview} {objectives} {schedule_text}"
-
-    # Classwork - in-class activities, practice
-    if any(word in all_text for word in ['classwork', 'class work', 'activity', 'practice', 'exercise', 'in-class', 'work on']):
-        if 'classwork' not in assessment:
-            assessment.append('classwork')
-
-    # Observation - teacher watching, monitoring
-    if any(word in all_text for word in ['observ', 'monitor', 'circulate', 'watch', 'check in', 'walk around']):
-        if 'observation' not in assessment:
-            assessment.append('observation')
-
-    # Project-based - projects, final products, deliverables
-    if any(word in all_text for word in ['project', 'final', 'deliverable', 'portfolio', 'create', 'produce', 'video project']):
-        if 'project_based' not in assessment:
-            assessment.append('project_based')
-
-    # Teamwork - group work, collaboration, partner work
-    if any(word in all_text for word in ['team', 'group', 'partner', 'collaborat', 'crew', 'together', 'peer']):
-        if 'teamwork' not in assessment:
-            assessment.append('teamwork')
-
-    # Performance - demonstrations, presentations by students
-    if any(word in all_text for word in ['perform', 'present', 'demonstrat', 'show', 'pitch', 'share out']):
-        if 'performance' not in assessment:
-            assessment.append('performance')
-
-    # On-Task - participation, engagement
-    if any(word in all_text for word in ['participat', 'engag', 'on-task', 'focused', 'active']):
-        if 'on_task' not in assessment:
-            assessment.append('on_task')
-
-    # Test - quiz, exam, test
-    if any(word in all_text for word in ['test', 'quiz', 'exam', 'assessment']):
-        if 'test' not in assessment:
-            assessment.append('test')
-
-    # Homework - take-home, assignment
-    if any(word in all_text for word in ['homework', 'home work', 'take home', 'assignment', 'due next']):
-        if 'homework' not in assessment:
-            assessment.append('homework')
-
-    # Exit ticket check
-    if any(word in all_text for word in ['exit ticket', 'exit slip', 'reflection']):
-        if 'classwork' not in assessment:
-            assessment.append('classwork')
+    if all_text is None:
+        all_text = get_lesson_text(day_data)
+    add_keyword_areas(assessment, all_text, ASSESSMENT_PATTERNS)
 
     return assessment
 
 
+# Leading "Students will" / "to" stripped from objectives in the overview.
+# (str.lstrip takes a set of characters, not a prefix, so it ate the start of
+# objectives like "Identify..." or "Edit...")
+OBJECTIVE_PREFIX_RE = re.compile(r'^\s*(?:students will\s+)?(?:to\s+)?', re.IGNORECASE)
+
+
+def clean_objective(objective):
+    """Lowercase an objective and drop a leading 'Students will' / 'to'."""
+    return OBJECTIVE_PREFIX_RE.sub('', objective, count=1).lower()
+
+
 def build_overview_text(day_data):
     """Build overview text from lesson data if not explicitly provided."""
     # If overview is explicitly provided, use it
@@ -829,12 +1079,11 @@ def build_overview_text(day_data):
     # Add objectives summary
     if objectives:
         if len(objectives) == 1:
-            overview_parts.append(f"The primary objective is to {objectives[0].lower().lstrip('students will ').lstrip('to ')}.")
+            overview_parts.append(f"The primary objective is to {clean_objective(objectives[0])}.")
         else:
-            overview_parts.append(f"Key objectives include: {objectives[0].lower().lstrip('students will ').lstrip('to ')}")
+            overview_parts.append(f"Key objectives include: {clean_objective(objectives[0])}")
             for obj in objectives[1:]:
-                clean_obj = obj.lower().lstrip('students will ').lstrip('to ')
-                overview_parts.append(f"and {clean_obj}")
+                overview_parts.append(f"and {clean_objective(obj)}")
 
     # Add activity highlights from schedule
     schedule = day_data.get('schedule', [])
@@ -853,18 +1102,20 @@ def build_overview_text(day_data):
 
 def generate_cte_lesson_plan(day_data, week_num, day_num):
     """Generate a single CTE format lesson plan document."""
-    doc = Document(TEMPLATE_PATH)
+    doc = Document(BytesIO(load_template_bytes()))
     table = doc.tables[0]
 
     # Build auto-generated fields
     procedures_text = build_procedures_text(day_data)
     differentiation_text = build_differentiation_text(day_data)
     overview_text = build_overview_text(day_data)
-    curriculum_areas = infer_curriculum_areas(day_data)
-    other_areas = infer_other_areas(day_data, curriculum_areas)
-    materials = infer_materials(day_data)
-    methods = infer_methods(day_data)
-    assessment = infer_assessment(day_data)
+    # Lesson text for keyword inference, built once and shared across the infer_* calls
+    lesson_text = get_lesson_text(day_data)
+    curriculum_areas = infer_curriculum_areas(day_data, get_lesson_text(day_data, include_schedule=False))
+    other_areas = infer_other_areas(day_data, curriculum_areas, lesson_text)
+    materials = infer_materials(day_data, get_lesson_text(day_data, include_materials=True))
+    methods = infer_methods(day_data, lesson_text)
+    assessment = infer_assessment(day_data, lesson_text)
 
     # Fill in all fields
     set_cell_text(table.rows[1].cells[0], f"Week: {week_num}")
@@ -896,6 +1147,113 @@ def generate_cte_lesson_plan(day_data, week_num, day_num):
     return output_path
 
 
+def run_per_day(fn, days, week_num, *args):
+    """
+    Call fn(day, week_num, day_num, *args) for each day, one worker process per
+    day. Falls back to serial generation only when the process pool can't be
+    started or breaks; exceptions raised by fn itself propagate unchanged.
+    Returns results in day order.
+    """
+    day_nums = range(1, len(days) + 1)
+    workers = min(len(days), os.cpu_count() or 1)
+
+    if workers > 1:
+        executor = None
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            futures = [executor.submit(fn, day, week_num, i, *args) for i, day in zip(day_nums, days)]
+        except (OSError, NotImplementedError, BrokenProcessPool, pickle.PicklingError) as e:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            print(f"Warning: Parallel generation unavailable ({e}); generating serially", file=sys.stderr)
+        else:
+            with executor:
+                try:
+                    return [future.result() for future in futures]
+                except (BrokenProcessPool, pickle.PicklingError) as e:
+                    print(f"Warning: Parallel generation failed ({e}); generating serially", file=sys.stderr)
+
+    return [fn(day, week_num, i, *args) for i, day in zip(day_nums, days)]
+
+
+def generate_cte_lesson_plans(days, week_num):
+    """
+    Generate CTE lesson plans for a list of days. Each plan is an independent
+    document, so days are built in parallel (see run_per_day).
+    Returns output paths in day order.
+    """
+    # Read the template before the pool starts so forked workers inherit it
+    load_template_bytes()
+    return run_per_day(generate_cte_lesson_plan, days, week_num)
+
+
+def add_text_box(shapes, left, top, width, height, text, font_name, font_size, color,
+                 bold=False, align=None, word_wrap=False):
+    """
+    Add a text box holding one styled run. Returns its text frame so callers
+    can add further paragraphs.
+    """
+    tf = shapes.add_textbox(left, top, width, height).text_frame
+    if word_wrap:
+        tf.word_wrap = True
+    p = tf.paragraphs[0]
+    if align is not None:
+        p.alignment = align
+    run = p.add_run()
+    run.text = text
+    font = run.font
+    font.name = font_name
+    font.size = font_size
+    if bold:
+        font.bold = True
+    font.color.rgb = color
+    return tf
+
+
+def add_bell_ringer_slide(prs, week_num, day_name, prompt_text, background, accent, subtitle_color):
+    """
+    Add a Bell Ringer slide: accent bar, title, week/day line, and the prompt
+    in a white box. Shared by the Bell Ringer deck and the daily presentations.
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+
+    bg_fill = slide.background.fill
+    bg_fill.solid()
+    bg_fill.fore_color.rgb = background
+
+    # Accent bar at top
+    accent_bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, PptxInches(0.15))
+    accent_bar.fill.solid()
+    accent_bar.fill.fore_color.rgb = accent
+    accent_bar.line.fill.background()
+
+    # "BELL RINGER" title
+    add_text_box(slide.shapes, PptxInches(0.5), PptxInches(0.8), PptxInches(12.333), PptxInches(1.0),
+                 "BELL RINGER", "Cambria", PptxPt(54), PPTX_WHITE,
+                 bold=True, align=PP_ALIGN.CENTER, word_wrap=True)
+
+    # Week/day info
+    add_text_box(slide.shapes, PptxInches(0.5), PptxInches(1.8), PptxInches(12.333), PptxInches(0.6),
+                 f"Week {week_num} • {day_name}", "Calibri", PptxPt(24), subtitle_color,
+                 align=PP_ALIGN.CENTER, word_wrap=True)
+
+    # Content box
+    content_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, PptxInches(0.75), PptxInches(2.8),
+                                         PptxInches(11.833), PptxInches(3.8))
+    content_box.fill.solid()
+    content_box.fill.fore_color.rgb = PPTX_WHITE
+    content_box.line.fill.background()
+
+    # Prompt, nudged down to sit centered in the box
+    prompt_frame = add_text_box(slide.shapes, PptxInches(1.25), PptxInches(3.2), PptxInches(10.833), PptxInches(3.0),
+                                prompt_text, "Calibri", PptxPt(32), background,
+                                align=PP_ALIGN.CENTER, word_wrap=True)
+    prompt_frame.auto_size = None
+    prompt_frame.paragraphs[0].space_before = PptxPt(20)
+
+    return slide
+
+
 def generate_bell_ringer_slides(week_data):
     """Generate Bell Ringer slides as PowerPoint for Canva upload."""
     week_num = week_data.get('week', '')
@@ -903,15 +1261,10 @@ def generate_bell_ringer_slides(week_data):
     days = week_data.get('days', [])
     day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
 
-    # Colors
-    NAVY_BLUE = PptxRGBColor(0x1a, 0x3c, 0x6e)
-    WHITE = PptxRGBColor(0xFF, 0xFF, 0xFF)
-    LIGHT_BLUE = PptxRGBColor(0xD6, 0xE3, 0xF8)
-
     # Create presentation (16:9 aspect ratio)
-    prs = Presentation()
-    prs.slide_width = PptxInches(13.333)
-    prs.slide_height = PptxInches(7.5)
+    prs = Presentation(BytesIO(load_presentation_template_bytes()))
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
 
     slides_created = []
 
@@ -926,7 +1279,7 @@ def generate_bell_ringer_slides(week_data):
         for activity in schedule:
             if isinstance(activity, dict):
                 activity_name = activity.get('name', activity.get('activity', '')).lower()
-                if 'bell ringer' in activity_name or 'bellringer' in activity_name or 'warm up' in activity_name or 'warmup' in activity_name:
+                if BELL_RINGER_NAME_RE.search(activity_name):
                     bell_ringer_text = activity.get('description', '')
                     break
 
@@ -934,90 +1287,7 @@ def generate_bell_ringer_slides(week_data):
         if not bell_ringer_text:
             bell_ringer_text = "[Add Bell Ringer prompt]"
 
-        # Create blank slide
-        blank_layout = prs.slide_layouts[6]  # Blank layout
-        slide = prs.slides.add_slide(blank_layout)
-
-        # Add navy background rectangle (full slide)
-        bg_shape = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            PptxInches(0), PptxInches(0),
-            prs.slide_width, prs.slide_height
-        )
-        bg_shape.fill.solid()
-        bg_shape.fill.fore_color.rgb = NAVY_BLUE
-        bg_shape.line.fill.background()
-
-        # Add decorative light blue accent bar at top
-        accent_bar = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            PptxInches(0), PptxInches(0),
-            prs.slide_width, PptxInches(0.15)
-        )
-        accent_bar.fill.solid()
-        accent_bar.fill.fore_color.rgb = LIGHT_BLUE
-        accent_bar.line.fill.background()
-
-        # Add "BELL RINGER" title
-        title_box = slide.shapes.add_textbox(
-            PptxInches(0.5), PptxInches(0.8),
-            PptxInches(12.333), PptxInches(1.0)
-        )
-        title_frame = title_box.text_frame
-        title_frame.word_wrap = True
-        title_para = title_frame.paragraphs[0]
-        title_para.alignment = PP_ALIGN.CENTER
-        title_run = title_para.add_run()
-        title_run.text = "BELL RINGER"
-        title_run.font.name = "Cambria"
-        title_run.font.size = PptxPt(54)
-        title_run.font.bold = True
-        title_run.font.color.rgb = WHITE
-
-        # Add day info subtitle
-        day_box = slide.shapes.add_textbox(
-            PptxInches(0.5), PptxInches(1.8),
-            PptxInches(12.333), PptxInches(0.6)
-        )
-        day_frame = day_box.text_frame
-        day_frame.word_wrap = True
-        day_para = day_frame.paragraphs[0]
-        day_para.alignment = PP_ALIGN.CENTER
-        day_run = day_para.add_run()
-        day_run.text = f"Week {week_num} • {day_name}"
-        day_run.font.name = "Calibri"
-        day_run.font.size = PptxPt(24)
-        day_run.font.color.rgb = LIGHT_BLUE
-
-        # Add content box with light background
-        content_box_shape = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            PptxInches(0.75), PptxInches(2.8),
-            PptxInches(11.833), PptxInches(3.8)
-        )
-        content_box_shape.fill.solid()
-        content_box_shape.fill.fore_color.rgb = WHITE
-        content_box_shape.line.fill.background()
-
-        # Add bell ringer prompt text
-        prompt_box = slide.shapes.add_textbox(
-            PptxInches(1.25), PptxInches(3.2),
-            PptxInches(10.833), PptxInches(3.0)
-        )
-        prompt_frame = prompt_box.text_frame
-        prompt_frame.word_wrap = True
-        prompt_frame.auto_size = None
-
-        prompt_para = prompt_frame.paragraphs[0]
-        prompt_para.alignment = PP_ALIGN.CENTER
-        prompt_run = prompt_para.add_run()
-        prompt_run.text = bell_ringer_text
-        prompt_run.font.name = "Calibri"
-        prompt_run.font.size = PptxPt(32)
-        prompt_run.font.color.rgb = NAVY_BLUE
-
-        # Center text vertically
-        prompt_frame.paragraphs[0].space_before = PptxPt(20)
+        add_bell_ringer_slide(prs, week_num, day_name, bell_ringer_text, PPTX_NAVY_BLUE, PPTX_LIGHT_BLUE, PPTX_LIGHT_BLUE)
 
         slides_created.append({
             'day': i,
@@ -1034,7 +1304,7 @@ def generate_bell_ringer_slides(week_data):
     filename = f"Week{week_num}_BellRinger_Slides.pptx"
     output_path = os.path.join(week_folder, filename)
 
-    prs.save(output_path)
+    save_presentation(prs, output_path)
     return output_path, slides_created
 
 
@@ -1057,28 +1327,27 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     # Get color theme for unit
     colors = UNIT_COLOR_THEMES.get(unit_name, DEFAULT_COLOR_THEME)
     PRIMARY_COLOR, SECONDARY_COLOR, ACCENT_COLOR = colors
-    WHITE = PptxRGBColor(0xFF, 0xFF, 0xFF)
-    DARK_GRAY = PptxRGBColor(0x33, 0x33, 0x33)
 
     # Track media for logging
     media_log = {'images': [], 'videos': []}
 
+    # Start the day's network lookups now so the topic image and video search
+    # run alongside each other (and slide building) instead of back to back
+    lookups = ThreadPoolExecutor(max_workers=2)
+    image_future = lookups.submit(get_topic_image, topic)
+    video_future = lookups.submit(search_youtube_video, topic)
+    lookups.shutdown(wait=False)
+
     # Create presentation (16:9 aspect ratio)
-    prs = Presentation()
-    prs.slide_width = PptxInches(13.333)
-    prs.slide_height = PptxInches(7.5)
+    prs = Presentation(BytesIO(load_presentation_template_bytes()))
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
 
     def add_background(slide, color):
-        """Add solid color background to slide."""
-        bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-        bg.fill.solid()
-        bg.fill.fore_color.rgb = color
-        bg.line.fill.background()
-        # Send to back
-        spTree = slide.shapes._spTree
-        sp = bg._element
-        spTree.remove(sp)
-        spTree.insert(2, sp)
+        """Fill the slide's own background with a solid color (no extra shape)."""
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = color
 
     def add_title_bar(slide, title_text, subtitle_text=None):
         """Add a colored title bar at top of slide."""
@@ -1089,16 +1358,8 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
         bar.line.fill.background()
 
         # Title text
-        title_box = slide.shapes.add_textbox(PptxInches(0.5), PptxInches(0.25), PptxInches(12.333), PptxInches(0.7))
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        run = p.add_run()
-        run.text = title_text
-        run.font.name = "Cambria"
-        run.font.size = PptxPt(40)
-        run.font.bold = True
-        run.font.color.rgb = WHITE
+        tf = add_text_box(slide.shapes, PptxInches(0.5), PptxInches(0.25), PptxInches(12.333), PptxInches(0.7),
+                          title_text, "Cambria", PptxPt(40), PPTX_WHITE, bold=True, align=PP_ALIGN.LEFT)
 
         if subtitle_text:
             p2 = tf.add_paragraph()
@@ -1127,12 +1388,15 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
             run = p.add_run()
             run.text = f"• {bullet}"
             run.font.name = "Calibri"
-            run.font.size = PptxPt(24)
-            run.font.color.rgb = DARK_GRAY
-            p.space_after = PptxPt(12)
+            run.font.size = BULLET_FONT_SIZE
+            run.font.color.rgb = PPTX_DARK_GRAY
+            p.space_after = BULLET_SPACE_AFTER
 
         # Try to add image on right
         if image_query:
+            # Wait for the prefetched topic image rather than fetching it again
+            if image_query == topic:
+                image_future.result()
             image_data, image_url = get_topic_image(image_query)
             if image_data:
                 try:
@@ -1141,67 +1405,28 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
                 except Exception as e:
                     print(f"Could not add image: {e}", file=sys.stderr)
 
+    # Pick out the schedule entries the slides draw on in a single pass
+    schedule = day_data.get('schedule', [])
+    bell_ringer = exit_ticket = None
+    practice_activities = []
+    for activity in schedule:
+        if isinstance(activity, dict):
+            name = activity.get('name', '').lower()
+            if bell_ringer is None and BELL_RINGER_NAME_RE.search(name):
+                bell_ringer = activity
+            if exit_ticket is None and EXIT_TICKET_NAME_RE.search(name):
+                exit_ticket = activity
+            if ACTIVITY_SLIDE_NAME_RE.search(name):
+                practice_activities.append(activity)
+
     # =========================================================================
     # SLIDE 1: BELL RINGER
     # =========================================================================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_background(slide, PRIMARY_COLOR)
-
-    # Find Bell Ringer text
     bell_ringer_text = "[Add Bell Ringer prompt]"
-    for activity in day_data.get('schedule', []):
-        if isinstance(activity, dict):
-            name = activity.get('name', '').lower()
-            if 'bell ringer' in name or 'warm up' in name:
-                bell_ringer_text = activity.get('description', bell_ringer_text)
-                break
-
-    # Accent bar
-    accent = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, PptxInches(0.15))
-    accent.fill.solid()
-    accent.fill.fore_color.rgb = ACCENT_COLOR
-    accent.line.fill.background()
-
-    # "BELL RINGER" title
-    title_box = slide.shapes.add_textbox(PptxInches(0.5), PptxInches(0.8), PptxInches(12.333), PptxInches(1.0))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "BELL RINGER"
-    run.font.name = "Cambria"
-    run.font.size = PptxPt(54)
-    run.font.bold = True
-    run.font.color.rgb = WHITE
-
-    # Day/Week info
-    info_box = slide.shapes.add_textbox(PptxInches(0.5), PptxInches(1.7), PptxInches(12.333), PptxInches(0.5))
-    tf = info_box.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = f"Week {week_num} • {day_name}"
-    run.font.name = "Calibri"
-    run.font.size = PptxPt(22)
-    run.font.color.rgb = SECONDARY_COLOR
+    if bell_ringer is not None:
+        bell_ringer_text = bell_ringer.get('description', bell_ringer_text)
 
-    # Content box
-    content_shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, PptxInches(0.75), PptxInches(2.6), PptxInches(11.833), PptxInches(4.2))
-    content_shape.fill.solid()
-    content_shape.fill.fore_color.rgb = WHITE
-    content_shape.line.fill.background()
-
-    # Bell ringer prompt
-    prompt_box = slide.shapes.add_textbox(PptxInches(1.2), PptxInches(3.2), PptxInches(10.9), PptxInches(3.2))
-    tf = prompt_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = bell_ringer_text
-    run.font.name = "Calibri"
-    run.font.size = PptxPt(32)
-    run.font.color.rgb = PRIMARY_COLOR
+    add_bell_ringer_slide(prs, week_num, day_name, bell_ringer_text, PRIMARY_COLOR, ACCENT_COLOR, SECONDARY_COLOR)
 
     # =========================================================================
     # SLIDE 2: AGENDA
@@ -1210,7 +1435,6 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     add_background(slide, SECONDARY_COLOR)
     add_title_bar(slide, "TODAY'S AGENDA", topic)
 
-    schedule = day_data.get('schedule', [])
     y_pos = 1.6
     for activity in schedule:
         if isinstance(activity, dict):
@@ -1229,18 +1453,13 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
                 time_run = time_tf.paragraphs[0].add_run()
                 time_run.text = time
                 time_run.font.name = "Calibri"
-                time_run.font.size = PptxPt(14)
+                time_run.font.size = AGENDA_TIME_FONT_SIZE
                 time_run.font.bold = True
-                time_run.font.color.rgb = WHITE
+                time_run.font.color.rgb = PPTX_WHITE
 
                 # Activity name
-                name_box = slide.shapes.add_textbox(PptxInches(2.0), PptxInches(y_pos + 0.08), PptxInches(10), PptxInches(0.5))
-                name_tf = name_box.text_frame
-                name_run = name_tf.paragraphs[0].add_run()
-                name_run.text = name
-                name_run.font.name = "Calibri"
-                name_run.font.size = PptxPt(22)
-                name_run.font.color.rgb = DARK_GRAY
+                add_text_box(slide.shapes, PptxInches(2.0), PptxInches(y_pos + 0.08), PptxInches(10), PptxInches(0.5),
+                             name, "Calibri", AGENDA_NAME_FONT_SIZE, PPTX_DARK_GRAY)
 
                 y_pos += 0.7
 
@@ -1272,22 +1491,17 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
 
             term_tf = term_box.text_frame
             term_tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-            term_tf.paragraphs[0].space_before = PptxPt(8)
+            term_tf.paragraphs[0].space_before = VOCAB_TERM_SPACE_BEFORE
             term_run = term_tf.paragraphs[0].add_run()
             term_run.text = term
             term_run.font.name = "Calibri"
-            term_run.font.size = PptxPt(18)
+            term_run.font.size = VOCAB_FONT_SIZE
             term_run.font.bold = True
-            term_run.font.color.rgb = WHITE
+            term_run.font.color.rgb = PPTX_WHITE
 
             # Definition
-            def_box = slide.shapes.add_textbox(PptxInches(3.7), PptxInches(y_pos + 0.1), PptxInches(9), PptxInches(0.5))
-            def_tf = def_box.text_frame
-            def_run = def_tf.paragraphs[0].add_run()
-            def_run.text = definition
-            def_run.font.name = "Calibri"
-            def_run.font.size = PptxPt(18)
-            def_run.font.color.rgb = DARK_GRAY
+            add_text_box(slide.shapes, PptxInches(3.7), PptxInches(y_pos + 0.1), PptxInches(9), PptxInches(0.5),
+                         definition, "Calibri", VOCAB_FONT_SIZE, PPTX_DARK_GRAY)
 
             y_pos += 0.8
 
@@ -1302,7 +1516,7 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     # =========================================================================
     # VIDEO SLIDE (if relevant video found)
     # =========================================================================
-    video_url, video_title = search_youtube_video(topic)
+    video_url, video_title = video_future.result()
     if video_url:
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         add_background(slide, SECONDARY_COLOR)
@@ -1311,51 +1525,33 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
         # Video placeholder box
         video_box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, PptxInches(1.5), PptxInches(1.8), PptxInches(10.333), PptxInches(5.2))
         video_box.fill.solid()
-        video_box.fill.fore_color.rgb = PptxRGBColor(0x20, 0x20, 0x20)
+        video_box.fill.fore_color.rgb = PPTX_VIDEO_BG
         video_box.line.fill.background()
 
         # Play button icon (triangle)
         play_btn = slide.shapes.add_shape(MSO_SHAPE.ISOSCELES_TRIANGLE, PptxInches(6.1), PptxInches(3.8), PptxInches(1.2), PptxInches(1.2))
         play_btn.fill.solid()
-        play_btn.fill.fore_color.rgb = WHITE
+        play_btn.fill.fore_color.rgb = PPTX_WHITE
         play_btn.rotation = 90
 
         # Video URL text
-        url_box = slide.shapes.add_textbox(PptxInches(1.5), PptxInches(6.2), PptxInches(10.333), PptxInches(0.5))
-        url_tf = url_box.text_frame
-        url_tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-        url_run = url_tf.paragraphs[0].add_run()
-        url_run.text = video_url
-        url_run.font.name = "Calibri"
-        url_run.font.size = PptxPt(12)
-        url_run.font.color.rgb = ACCENT_COLOR
+        add_text_box(slide.shapes, PptxInches(1.5), PptxInches(6.2), PptxInches(10.333), PptxInches(0.5),
+                     video_url, "Calibri", PptxPt(12), ACCENT_COLOR, align=PP_ALIGN.CENTER)
 
         media_log['videos'].append({'title': video_title, 'url': video_url})
 
     # =========================================================================
     # ACTIVITY/PRACTICE SLIDES
     # =========================================================================
-    # Find guided practice and hands-on activities from schedule
-    for activity in schedule:
-        if isinstance(activity, dict):
-            name = activity.get('name', '').lower()
-            desc = activity.get('description', '')
-
-            if any(word in name for word in ['practice', 'activity', 'hands-on', 'work time', 'project']):
-                slide = prs.slides.add_slide(prs.slide_layouts[6])
-                add_background(slide, SECONDARY_COLOR)
-                add_title_bar(slide, activity.get('name', 'ACTIVITY').upper())
+    # One slide per guided practice / hands-on activity
+    for activity in practice_activities:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        add_background(slide, SECONDARY_COLOR)
+        add_title_bar(slide, activity.get('name', 'ACTIVITY').upper())
 
-                # Activity description
-                desc_box = slide.shapes.add_textbox(PptxInches(0.5), PptxInches(1.5), PptxInches(12.333), PptxInches(5.5))
-                tf = desc_box.text_frame
-                tf.word_wrap = True
-                p = tf.paragraphs[0]
-                run = p.add_run()
-                run.text = desc
-                run.font.name = "Calibri"
-                run.font.size = PptxPt(28)
-                run.font.color.rgb = DARK_GRAY
+        # Activity description
+        add_text_box(slide.shapes, PptxInches(0.5), PptxInches(1.5), PptxInches(12.333), PptxInches(5.5),
+                     activity.get('description', ''), "Calibri", PptxPt(28), PPTX_DARK_GRAY, word_wrap=True)
 
     # =========================================================================
     # WRAP-UP SLIDE
@@ -1364,33 +1560,17 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     add_background(slide, PRIMARY_COLOR)
 
     # Title
-    title_box = slide.shapes.add_textbox(PptxInches(0.5), PptxInches(0.5), PptxInches(12.333), PptxInches(1.0))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "WRAP-UP"
-    run.font.name = "Cambria"
-    run.font.size = PptxPt(48)
-    run.font.bold = True
-    run.font.color.rgb = WHITE
+    add_text_box(slide.shapes, PptxInches(0.5), PptxInches(0.5), PptxInches(12.333), PptxInches(1.0),
+                 "WRAP-UP", "Cambria", PptxPt(48), PPTX_WHITE, bold=True, align=PP_ALIGN.CENTER)
 
     # Key takeaways box
     takeaway_shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, PptxInches(0.5), PptxInches(1.8), PptxInches(6), PptxInches(4.5))
     takeaway_shape.fill.solid()
-    takeaway_shape.fill.fore_color.rgb = WHITE
+    takeaway_shape.fill.fore_color.rgb = PPTX_WHITE
     takeaway_shape.line.fill.background()
 
-    takeaway_box = slide.shapes.add_textbox(PptxInches(0.8), PptxInches(2.0), PptxInches(5.5), PptxInches(4.0))
-    tf = takeaway_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Key Takeaways:"
-    run.font.name = "Cambria"
-    run.font.size = PptxPt(22)
-    run.font.bold = True
-    run.font.color.rgb = PRIMARY_COLOR
+    tf = add_text_box(slide.shapes, PptxInches(0.8), PptxInches(2.0), PptxInches(5.5), PptxInches(4.0),
+                      "Key Takeaways:", "Cambria", PptxPt(22), PRIMARY_COLOR, bold=True, word_wrap=True)
 
     if objectives:
         for obj in objectives[:3]:
@@ -1398,8 +1578,8 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
             run = p.add_run()
             run.text = f"- {obj[:60]}..." if len(obj) > 60 else f"- {obj}"
             run.font.name = "Calibri"
-            run.font.size = PptxPt(16)
-            run.font.color.rgb = DARK_GRAY
+            run.font.size = TAKEAWAY_FONT_SIZE
+            run.font.color.rgb = PPTX_DARK_GRAY
 
     # Exit ticket box
     exit_shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, PptxInches(6.833), PptxInches(1.8), PptxInches(6), PptxInches(4.5))
@@ -1407,32 +1587,19 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     exit_shape.fill.fore_color.rgb = ACCENT_COLOR
     exit_shape.line.fill.background()
 
-    exit_box = slide.shapes.add_textbox(PptxInches(7.1), PptxInches(2.0), PptxInches(5.5), PptxInches(4.0))
-    tf = exit_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Exit Ticket"
-    run.font.name = "Cambria"
-    run.font.size = PptxPt(22)
-    run.font.bold = True
-    run.font.color.rgb = WHITE
+    tf = add_text_box(slide.shapes, PptxInches(7.1), PptxInches(2.0), PptxInches(5.5), PptxInches(4.0),
+                      "Exit Ticket", "Cambria", PptxPt(22), PPTX_WHITE, bold=True, word_wrap=True)
 
-    # Find exit ticket from schedule
     exit_text = "What did you learn today?"
-    for activity in schedule:
-        if isinstance(activity, dict):
-            name = activity.get('name', '').lower()
-            if 'wrap' in name or 'exit' in name or 'reflection' in name:
-                exit_text = activity.get('description', exit_text)
-                break
+    if exit_ticket is not None:
+        exit_text = exit_ticket.get('description', exit_text)
 
     p = tf.add_paragraph()
     run = p.add_run()
     run.text = exit_text
     run.font.name = "Calibri"
     run.font.size = PptxPt(18)
-    run.font.color.rgb = WHITE
+    run.font.color.rgb = PPTX_WHITE
 
     # Save presentation
     week_folder = get_week_folder(week_num)
@@ -1440,10 +1607,31 @@ def generate_daily_presentation(day_data, week_num, day_num, unit_name=''):
     filename = f"Day{day_num}_{topic_slug}_Presentation.pptx"
     output_path = os.path.join(week_folder, filename)
 
-    prs.save(output_path)
+    save_presentation(prs, output_path)
     return output_path, media_log
 
 
+def try_generate_daily_presentation(day, week_num, day_num, unit_name):
+    """Generate one day's presentation, reporting a failure instead of raising it.
+    Returns (pres_path, media_log), or (None, []) if the day failed."""
+    try:
+        return generate_daily_presentation(day, week_num, day_num, unit_name)
+    except Exception as e:
+        print(f"Warning: Could not generate presentation for Day {day_num}: {e}", file=sys.stderr)
+        return None, []
+
+
+def generate_daily_presentations(days, week_num, unit_name):
+    """
+    Generate daily presentations for a list of days in parallel (see
+    run_per_day). Image and video lookups overlap across days instead of
+    running back to back. Returns (pres_path, media_log) pairs in day order.
+    """
+    # Read the template before the pool starts so forked workers inherit it
+    load_presentation_template_bytes()
+    return run_per_day(try_generate_daily_presentation, days, week_num, unit_name)
+
+
 def generate_week(data):
     """Generate all documents for a week: CTE lesson plans and daily presentations.
     
@@ -1466,9 +1654,7 @@ def generate_week(data):
     results['week_folder'] = get_week_folder(week_num)
 
     # Generate individual CTE lesson plans
-    for i, day in enumerate(days, 1):
-        path = generate_cte_lesson_plan(day, week_num, i)
-        results['cte_plans'].append(path)
+    results['cte_plans'] = generate_cte_lesson_plans(days, week_num)
 
     # NOTE: Teacher and Student handouts should be generated separately using the docx skill
     # See templates/teacher-handout.js and templates/student-handout.js for reference
@@ -1476,22 +1662,18 @@ def generate_week(data):
     # Generate daily lesson presentations (unless skip_presentations is True)
     all_media_log = []
     if not skip_presentations:
-        for i, day in enumerate(days, 1):
-            try:
-                pres_path, media_log = generate_daily_presentation(day, week_num, i, unit_name)
+        for pres_path, media_log in generate_daily_presentations(days, week_num, unit_name):
+            if pres_path:
                 results['daily_presentations'].append(pres_path)
                 all_media_log.extend(media_log)
-            except Exception as e:
-                print(f"Warning: Could not generate presentation for Day {i}: {e}", file=sys.stderr)
 
         # Write media log file
         if all_media_log:
             media_log_path = os.path.join(results['week_folder'], f"Week{week_num}_Media_Log.txt")
+            lines = [f"Media Log - Week {week_num}: {unit_name}", "=" * 60, ""]
+            lines.extend(str(entry) for entry in all_media_log)
             with open(media_log_path, 'w') as f:
-                f.write(f"Media Log - Week {week_num}: {unit_name}\n")
-                f.write("=" * 60 + "\n\n")
-                for entry in all_media_log:
-                    f.write(f"{entry}\n")
+                f.write("\n".join(lines) + "\n")
             results['media_log'] = media_log_path
 
     return results
@@ -15,26 +15,67 @@ const LIGHT_BLUE = "D5E8F0";
 const LIGHT_GRAY = "F5F5F5";
 const CREAM_YELLOW = "FFF9E6";
 const BORDER_GRAY = "CCCCCC";
+const WHITE = "FFFFFF";
 
 // Standard border style
 const thinBorder = { style: BorderStyle.SINGLE, size: 1, color: BORDER_GRAY };
 const borders = { top: thinBorder, bottom: thinBorder, left: thinBorder, right: thinBorder };
 
+// Cell margins for padding
+const cellMargins = { top: 80, bottom: 80, left: 120, right: 120 };
+const headerCellMargins = { top: 200, bottom: 200, left: 200, right: 200 };
+const introCellMargins = { top: 150, bottom: 150, left: 200, right: 200 };
+const boxCellMargins = { top: 120, bottom: 120, left: 150, right: 150 };
+
+// Solid cell shading for a fill color
+function shading(fill) {
+    return { fill, type: ShadingType.CLEAR };
+}
+
+// Blank answer line written under each question
+const ANSWER_LINE = "_".repeat(80);
+const answerLineSpacing = { after: 160 };
+
+// Alternating vocabulary row fills (even, odd)
+const vocabRowShading = [shading(LIGHT_BLUE), shading(WHITE)];
+
+// Section header fragments, shared by every header built
+const sectionHeaderSpacing = { before: 200, after: 120 };
+const sectionHeaderBorder = { bottom: { style: BorderStyle.SINGLE, size: 12, color: NAVY } };
+
 /**
  * Creates a section header with bottom border
  */
 function sectionHeader(text) {
     return new Paragraph({
-        spacing: { before: 200, after: 120 },
-        border: {
-            bottom: { style: BorderStyle.SINGLE, size: 12, color: NAVY }
-        },
+        spacing: sectionHeaderSpacing,
+        border: sectionHeaderBorder,
         children: [
             new TextRun({ text: text, bold: true, color: NAVY, size: 26 })
         ]
     });
 }
 
+/**
+ * Creates a bordered, shaded table cell holding a single text run
+ */
+function filledCell(width, cellShading, margins, run) {
+    return new TableCell({
+        width: { size: width, type: WidthType.DXA },
+        borders,
+        shading: cellShading,
+        margins,
+        children: [new Paragraph({ children: [run] })]
+    });
+}
+
+/**
+ * Creates an empty paragraph used as vertical spacing
+ */
+function spacer(after) {
+    return new Paragraph({ spacing: { after } });
+}
+
 /**
  * Generate a Student Handout document
  */
@@ -51,8 +92,8 @@ function generateStudentHandout(handoutData) {
                     children: [
                         new TableCell({
                             width: { size: 10800, type: WidthType.DXA },
-                            shading: { fill: NAVY, type: ShadingType.CLEAR },
-                            margins: { top: 200, bottom: 200, left: 200, right: 200 },
+                            shading: shading(NAVY),
+                            margins: headerCellMargins,
                             children: [
                                 new Paragraph({
                                     alignment: AlignmentType.CENTER,
@@ -60,7 +101,7 @@ function generateStudentHandout(handoutData) {
                                         new TextRun({ 
                                             text: handoutData.title || "Student Handout", 
                                             bold: true, 
-                                            color: "FFFFFF", 
+                                            color: WHITE, 
                                             size: 36 
                                         })
                                     ]
@@ -85,7 +126,7 @@ function generateStudentHandout(handoutData) {
         })
     );
     
-    children.push(new Paragraph({ spacing: { after: 200 } }));
+    children.push(spacer(200));
     
     // ========== INTRO/INSTRUCTIONS ==========
     const intro = handoutData.intro || handoutData.instructions;
@@ -100,8 +141,8 @@ function generateStudentHandout(handoutData) {
                             new TableCell({
                                 width: { size: 10800, type: WidthType.DXA },
                                 borders,
-                                shading: { fill: LIGHT_BLUE, type: ShadingType.CLEAR },
-                                margins: { top: 150, bottom: 150, left: 200, right: 200 },
+                                shading: shading(LIGHT_BLUE),
+                                margins: introCellMargins,
                                 children: [
                                     new Paragraph({
                                         children: [new TextRun({ text: intro })]
@@ -113,7 +154,7 @@ function generateStudentHandout(handoutData) {
                 ]
             })
         );
-        children.push(new Paragraph({ spacing: { after: 200 } }));
+        children.push(spacer(200));
     }
     
     // ========== SECTIONS ==========
@@ -155,7 +196,7 @@ function generateStudentHandout(handoutData) {
             );
         }
         
-        children.push(new Paragraph({ spacing: { after: 160 } }));
+        children.push(spacer(160));
     });
     
     // ========== VOCABULARY ==========
@@ -165,31 +206,11 @@ function generateStudentHandout(handoutData) {
         children.push(sectionHeader("VOCABULARY"));
         
         const vocabRows = vocabEntries.map(([term, definition], i) => {
-            const rowFill = i % 2 === 0 ? LIGHT_BLUE : "FFFFFF";
+            const rowShading = vocabRowShading[i & 1];
             return new TableRow({
                 children: [
-                    new TableCell({
-                        width: { size: 2500, type: WidthType.DXA },
-                        borders,
-                        shading: { fill: rowFill, type: ShadingType.CLEAR },
-                        margins: { top: 80, bottom: 80, left: 120, right: 120 },
-                        children: [
-                            new Paragraph({
-                                children: [new TextRun({ text: term, bold: true, size: 20 })]
-                            })
-                        ]
-                    }),
-                    new TableCell({
-                        width: { size: 8300, type: WidthType.DXA },
-                        borders,
-                        shading: { fill: rowFill, type: ShadingType.CLEAR },
-                        margins: { top: 80, bottom: 80, left: 120, right: 120 },
-                        children: [
-                            new Paragraph({
-                                children: [new TextRun({ text: definition, size: 20 })]
-                            })
-                        ]
-                    })
+                    filledCell(2500, rowShading, cellMargins, new TextRun({ text: term, bold: true, size: 20 })),
+                    filledCell(8300, rowShading, cellMargins, new TextRun({ text: definition, size: 20 }))
                 ]
             });
         });
@@ -202,7 +223,7 @@ function generateStudentHandout(handoutData) {
             })
         );
         
-        children.push(new Paragraph({ spacing: { after: 200 } }));
+        children.push(spacer(200));
     }
     
     // ========== QUESTIONS ==========
@@ -223,15 +244,15 @@ function generateStudentHandout(handoutData) {
             // Answer line
             children.push(
                 new Paragraph({
-                    spacing: { after: 160 },
+                    spacing: answerLineSpacing,
                     children: [
-                        new TextRun({ text: "_".repeat(80), color: BORDER_GRAY })
+                        new TextRun({ text: ANSWER_LINE, color: BORDER_GRAY })
                     ]
                 })
             );
         });
         
-        children.push(new Paragraph({ spacing: { after: 200 } }));
+        children.push(spacer(200));
     }
     
     // ========== TIPS ==========
@@ -262,8 +283,8 @@ function generateStudentHandout(handoutData) {
                             new TableCell({
                                 width: { size: 10800, type: WidthType.DXA },
                                 borders,
-                                shading: { fill: CREAM_YELLOW, type: ShadingType.CLEAR },
-                                margins: { top: 120, bottom: 120, left: 150, right: 150 },
+                                shading: shading(CREAM_YELLOW),
+                                margins: boxCellMargins,
                                 children: tipParagraphs
                             })
                         ]
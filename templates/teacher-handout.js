@@ -15,6 +15,7 @@ const LIGHT_BLUE = "D5E8F0";
 const LIGHT_GRAY = "F5F5F5";
 const CREAM_YELLOW = "FFF9E6";
 const BORDER_GRAY = "CCCCCC";
+const WHITE = "FFFFFF";
 
 // Standard border style
 const thinBorder = { style: BorderStyle.SINGLE, size: 1, color: BORDER_GRAY };
@@ -23,22 +24,59 @@ const borders = { top: thinBorder, bottom: thinBorder, left: thinBorder, right:
 // Cell margins for padding
 const cellMargins = { top: 80, bottom: 80, left: 120, right: 120 };
 const headerCellMargins = { top: 150, bottom: 150, left: 200, right: 200 };
+const compactCellMargins = { top: 60, bottom: 60, left: 80, right: 80 };
+const boxCellMargins = { top: 120, bottom: 120, left: 150, right: 150 };
+const noteCellMargins = { top: 100, bottom: 100, left: 150, right: 150 };
+const dayTopicMargins = { left: 150 };
+
+// Solid cell shading for a fill color
+function shading(fill) {
+    return { fill, type: ShadingType.CLEAR };
+}
+
+// Alternating schedule row fills (even, odd)
+const scheduleRowShading = [shading(WHITE), shading(LIGHT_GRAY)];
+
+// Section header fragments, shared by every header built
+const sectionHeaderSpacing = { before: 200, after: 120 };
+const sectionHeaderBorder = { bottom: { style: BorderStyle.SINGLE, size: 12, color: NAVY } };
+
+// Default: 5 days per week (Monday - Friday)
+const DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'];
 
 /**
  * Creates a section header with bottom border
  */
 function sectionHeader(text) {
     return new Paragraph({
-        spacing: { before: 200, after: 120 },
-        border: {
-            bottom: { style: BorderStyle.SINGLE, size: 12, color: NAVY }
-        },
+        spacing: sectionHeaderSpacing,
+        border: sectionHeaderBorder,
         children: [
             new TextRun({ text: text, bold: true, color: NAVY, size: 26 })
         ]
     });
 }
 
+/**
+ * Creates a bordered, shaded table cell holding a single text run
+ */
+function filledCell(width, cellShading, margins, run) {
+    return new TableCell({
+        width: { size: width, type: WidthType.DXA },
+        borders,
+        shading: cellShading,
+        margins,
+        children: [new Paragraph({ children: [run] })]
+    });
+}
+
+/**
+ * Creates an empty paragraph used as vertical spacing
+ */
+function spacer(after) {
+    return new Paragraph({ spacing: { after } });
+}
+
 /**
  * Generate a Teacher Handout document
  */
@@ -58,7 +96,7 @@ function generateTeacherHandout(weekData) {
                     children: [
                         new TableCell({
                             width: { size: 10800, type: WidthType.DXA },
-                            shading: { fill: NAVY, type: ShadingType.CLEAR },
+                            shading: shading(NAVY),
                             margins: headerCellMargins,
                             children: [
                                 new Paragraph({
@@ -67,7 +105,7 @@ function generateTeacherHandout(weekData) {
                                         new TextRun({ 
                                             text: `WEEK ${weekNum}: ${unitName.toUpperCase()}`, 
                                             bold: true, 
-                                            color: "FFFFFF", 
+                                            color: WHITE, 
                                             size: 36 
                                         })
                                     ]
@@ -90,7 +128,7 @@ function generateTeacherHandout(weekData) {
         })
     );
     
-    children.push(new Paragraph({ spacing: { after: 200 } }));
+    children.push(spacer(200));
     
     // ========== WEEK OVERVIEW ==========
     if (weekData.week_overview) {
@@ -104,8 +142,8 @@ function generateTeacherHandout(weekData) {
                             new TableCell({
                                 width: { size: 10800, type: WidthType.DXA },
                                 borders,
-                                shading: { fill: LIGHT_BLUE, type: ShadingType.CLEAR },
-                                margins: { top: 150, bottom: 150, left: 200, right: 200 },
+                                shading: shading(LIGHT_BLUE),
+                                margins: headerCellMargins,
                                 children: [
                                     new Paragraph({
                                         children: [
@@ -125,7 +163,7 @@ function generateTeacherHandout(weekData) {
                 ]
             })
         );
-        children.push(new Paragraph({ spacing: { after: 200 } }));
+        children.push(spacer(200));
     }
     
     // ========== LEARNING OBJECTIVES ==========
@@ -144,7 +182,7 @@ function generateTeacherHandout(weekData) {
         );
     });
     
-    children.push(new Paragraph({ spacing: { after: 200 } }));
+    children.push(spacer(200));
     
     // ========== MATERIALS NEEDED ==========
     children.push(sectionHeader("MATERIALS NEEDED"));
@@ -159,7 +197,7 @@ function generateTeacherHandout(weekData) {
         );
     });
     
-    children.push(new Paragraph({ spacing: { after: 200 } }));
+    children.push(spacer(200));
     
     // ========== ASSESSMENT ==========
     children.push(sectionHeader("ASSESSMENT"));
@@ -182,8 +220,8 @@ function generateTeacherHandout(weekData) {
                         new TableCell({
                             width: { size: 3600, type: WidthType.DXA },
                             borders,
-                            shading: { fill: assessFills[i], type: ShadingType.CLEAR },
-                            margins: { top: 120, bottom: 120, left: 150, right: 150 },
+                            shading: shading(assessFills[i]),
+                            margins: boxCellMargins,
                             children: [
                                 new Paragraph({
                                     children: [
@@ -204,13 +242,11 @@ function generateTeacherHandout(weekData) {
         })
     );
     
-    children.push(new Paragraph({ spacing: { after: 300 } }));
+    children.push(spacer(300));
     
     // ========== DAILY BREAKDOWN ==========
     children.push(sectionHeader("DAILY BREAKDOWN"));
     
-    // Default: 5 days per week (Monday - Friday)
-    const dayNames = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'];
     const days = weekData.days || [];
     
     days.forEach((day, dayIdx) => {
@@ -224,26 +260,26 @@ function generateTeacherHandout(weekData) {
                         children: [
                             new TableCell({
                                 width: { size: 1200, type: WidthType.DXA },
-                                shading: { fill: NAVY, type: ShadingType.CLEAR },
+                                shading: shading(NAVY),
                                 verticalAlign: VerticalAlign.CENTER,
                                 children: [
                                     new Paragraph({
                                         alignment: AlignmentType.CENTER,
                                         children: [
-                                            new TextRun({ text: `DAY ${dayIdx + 1}`, bold: true, color: "FFFFFF" })
+                                            new TextRun({ text: `DAY ${dayIdx + 1}`, bold: true, color: WHITE })
                                         ]
                                     })
                                 ]
                             }),
                             new TableCell({
                                 width: { size: 9600, type: WidthType.DXA },
-                                shading: { fill: LIGHT_BLUE, type: ShadingType.CLEAR },
-                                margins: { left: 150 },
+                                shading: shading(LIGHT_BLUE),
+                                margins: dayTopicMargins,
                                 verticalAlign: VerticalAlign.CENTER,
                                 children: [
                                     new Paragraph({
                                         children: [
-                                            new TextRun({ text: `${dayNames[dayIdx] || 'Day ' + (dayIdx + 1)}: `, bold: true }),
+                                            new TextRun({ text: `${DAY_NAMES[dayIdx] || 'Day ' + (dayIdx + 1)}: `, bold: true }),
                                             new TextRun({ text: day.topic || '' })
                                         ]
                                     })
@@ -255,7 +291,7 @@ function generateTeacherHandout(weekData) {
             })
         );
         
-        children.push(new Paragraph({ spacing: { after: 100 } }));
+        children.push(spacer(100));
         
         // Day objectives
         const dayObjectives = day.objectives || [];
@@ -276,7 +312,7 @@ function generateTeacherHandout(weekData) {
                 );
             });
             
-            children.push(new Paragraph({ spacing: { after: 80 } }));
+            children.push(spacer(80));
         }
         
         // Schedule table
@@ -286,57 +322,28 @@ function generateTeacherHandout(weekData) {
                 // Header row
                 new TableRow({
                     children: [
-                        new TableCell({
-                            width: { size: 1400, type: WidthType.DXA },
-                            borders,
-                            shading: { fill: NAVY, type: ShadingType.CLEAR },
-                            margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                            children: [new Paragraph({ children: [new TextRun({ text: "TIME", bold: true, color: "FFFFFF", size: 18 })] })]
-                        }),
-                        new TableCell({
-                            width: { size: 2200, type: WidthType.DXA },
-                            borders,
-                            shading: { fill: NAVY, type: ShadingType.CLEAR },
-                            margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                            children: [new Paragraph({ children: [new TextRun({ text: "ACTIVITY", bold: true, color: "FFFFFF", size: 18 })] })]
-                        }),
-                        new TableCell({
-                            width: { size: 7200, type: WidthType.DXA },
-                            borders,
-                            shading: { fill: NAVY, type: ShadingType.CLEAR },
-                            margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                            children: [new Paragraph({ children: [new TextRun({ text: "DESCRIPTION", bold: true, color: "FFFFFF", size: 18 })] })]
-                        })
+                        filledCell(1400, shading(NAVY), compactCellMargins, new TextRun({ text: "TIME", bold: true, color: WHITE, size: 18 })),
+                        filledCell(2200, shading(NAVY), compactCellMargins, new TextRun({ text: "ACTIVITY", bold: true, color: WHITE, size: 18 })),
+                        filledCell(7200, shading(NAVY), compactCellMargins, new TextRun({ text: "DESCRIPTION", bold: true, color: WHITE, size: 18 }))
                     ]
                 })
             ];
             
-            schedule.forEach((activity, rowIdx) => {
-                const rowFill = rowIdx % 2 === 0 ? "FFFFFF" : LIGHT_GRAY;
+            // Resolve each activity's field fallbacks once, before building rows
+            const activities = schedule.map(activity => [
+                activity.time || activity.duration || '',
+                activity.name || activity.activity || '',
+                activity.description || ''
+            ]);
+            
+            activities.forEach(([time, name, description], rowIdx) => {
+                const rowShading = scheduleRowShading[rowIdx & 1];
                 scheduleRows.push(
                     new TableRow({
                         children: [
-                            new TableCell({
-                                width: { size: 1400, type: WidthType.DXA },
-                                borders,
-                                shading: { fill: rowFill, type: ShadingType.CLEAR },
-                                margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                                children: [new Paragraph({ children: [new TextRun({ text: activity.time || activity.duration || '', bold: true, size: 18 })] })]
-                            }),
-                            new TableCell({
-                                width: { size: 2200, type: WidthType.DXA },
-                                borders,
-                                shading: { fill: rowFill, type: ShadingType.CLEAR },
-                                margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                                children: [new Paragraph({ children: [new TextRun({ text: activity.name || activity.activity || '', size: 18 })] })]
-                            }),
-                            new TableCell({
-                                width: { size: 7200, type: WidthType.DXA },
-                                borders,
-                                shading: { fill: rowFill, type: ShadingType.CLEAR },
-                                margins: { top: 60, bottom: 60, left: 80, right: 80 },
-                                children: [new Paragraph({ children: [new TextRun({ text: activity.description || '', size: 18 })] })]
-                            })
+                            filledCell(1400, rowShading, compactCellMargins, new TextRun({ text: time, bold: true, size: 18 })),
+                            filledCell(2200, rowShading, compactCellMargins, new TextRun({ text: name, size: 18 })),
+                            filledCell(7200, rowShading, compactCellMargins, new TextRun({ text: description, size: 18 }))
                         ]
                     })
                 );
@@ -353,7 +360,7 @@ function generateTeacherHandout(weekData) {
         
         // Teacher notes
         if (day.teacher_notes) {
-            children.push(new Paragraph({ spacing: { after: 100 } }));
+            children.push(spacer(100));
             children.push(
                 new Table({
                     width: { size: 10800, type: WidthType.DXA },
@@ -364,8 +371,8 @@ function generateTeacherHandout(weekData) {
                                 new TableCell({
                                     width: { size: 10800, type: WidthType.DXA },
                                     borders,
-                                    shading: { fill: CREAM_YELLOW, type: ShadingType.CLEAR },
-                                    margins: { top: 100, bottom: 100, left: 150, right: 150 },
+                                    shading: shading(CREAM_YELLOW),
+                                    margins: noteCellMargins,
                                     children: [
                                         new Paragraph({
                                             children: [
@@ -382,7 +389,7 @@ function generateTeacherHandout(weekData) {
             );
         }
         
-        children.push(new Paragraph({ spacing: { after: 300 } }));
+        children.push(spacer(300));
     });
     
     // Create document